@@ -7,12 +7,37 @@ Flask web application for diabetes risk prediction with modern UI
 """
 
 from flask import Flask, render_template, request, jsonify, flash
-import os
+from flask.json.provider import JSONProvider
+import numpy as np
+import orjson
 from datetime import datetime
-from diabetes_predictor import DiabetesPredictor
+from diabetes_predictor import DiabetesPredictor, InvalidInputError, _infer
+from model_loader import discover_models
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider using orjson for faster request/response (de)serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
 app.secret_key = 'diabetes_prediction_secret_key_2024'
+app.json = OrjsonProvider(app)
+
+# Form field names mapped to model feature names
+FIELD_MAP = {
+    'pregnancies': 'Pregnancies',
+    'glucose': 'Glucose',
+    'blood_pressure': 'BloodPressure',
+    'skin_thickness': 'SkinThickness',
+    'insulin': 'Insulin',
+    'bmi': 'BMI',
+    'diabetes_pedigree': 'DiabetesPedigreeFunction',
+    'age': 'Age'
+}
 
 # Global predictor instance
 predictor = None
@@ -22,25 +47,10 @@ def initialize_predictor():
     global predictor
 
     # Auto-detect model files in current directory or models folder
-    model_files = []
-    scaler_file = None
-
-    # Check current directory first
-    if os.path.exists('.'):
-        model_files = [f for f in os.listdir('.') if f.startswith('diabetes_prediction_model_') and f.endswith('.pkl')]
-        if os.path.exists('diabetes_scaler.pkl'):
-            scaler_file = 'diabetes_scaler.pkl'
-
-    # Check models directory if not found in current directory
-    if not model_files and os.path.exists('models'):
-        model_files = [os.path.join('models', f) for f in os.listdir('models')
-                      if f.startswith('diabetes_prediction_model_') and f.endswith('.pkl')]
-        if os.path.exists('models/diabetes_scaler.pkl'):
-            scaler_file = 'models/diabetes_scaler.pkl'
-
-    if model_files and scaler_file:
-        model_path = model_files[0]
-        scaler_path = scaler_file
+    model_files = discover_models()
+
+    if model_files:
+        model_path, scaler_path = model_files
         predictor = DiabetesPredictor(model_path, scaler_path)
         print(f"✓ Model loaded: {model_path}")
         return True
@@ -65,37 +75,22 @@ def predict():
         # Get form data
         data = request.get_json()
 
-        # Validate required fields
-        required_fields = ['pregnancies', 'glucose', 'blood_pressure', 'skin_thickness',
-                          'insulin', 'bmi', 'diabetes_pedigree', 'age']
-
-        patient_data = {}
-        for field in required_fields:
+        # Validate required fields and map to model feature names
+        prediction_data = {}
+        for field, feature in FIELD_MAP.items():
             if field not in data:
                 return jsonify({'error': f'Missing field: {field}'}), 400
 
             try:
-                patient_data[field.replace('_', '').title() if field != 'bmi' else 'BMI'] = float(data[field])
-            except ValueError:
+                prediction_data[feature] = float(data[field])
+            except (TypeError, ValueError):
                 return jsonify({'error': f'Invalid value for {field}'}), 400
 
-        # Map to correct field names
-        prediction_data = {
-            'Pregnancies': patient_data['Pregnancies'],
-            'Glucose': patient_data['Glucose'],
-            'BloodPressure': patient_data['Bloodpressure'],
-            'SkinThickness': patient_data['Skinthickness'],
-            'Insulin': patient_data['Insulin'],
-            'BMI': patient_data['BMI'],
-            'DiabetesPedigreeFunction': patient_data['Diabetespedigree'],
-            'Age': patient_data['Age']
-        }
-
         # Make prediction
-        result = predictor.predict_single(prediction_data)
-
-        if result is None:
-            return jsonify({'error': 'Invalid input data'}), 400
+        try:
+            result = predictor.predict_single(prediction_data)
+        except InvalidInputError as e:
+            return jsonify({'error': 'Invalid input data', 'invalid_fields': e.fields}), 400
 
         # Format response
         response = {
@@ -113,6 +108,62 @@ def predict():
     except Exception as e:
         return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
 
+@app.route('/predict_batch', methods=['POST'])
+def predict_batch():
+    """
+    Handle batch prediction request for a JSON array of patients
+
+    Each item uses the batch CSV field names (Pregnancies, Glucose, ...).
+    Recommended batch size is 256-1024 patients per request.
+    """
+    try:
+        # silent=True: malformed JSON or a non-JSON body falls into the 400 below
+        data = request.get_json(silent=True)
+        if not isinstance(data, list) or not data:
+            return jsonify({'error': 'Expected a non-empty JSON array of patients'}), 400
+
+        # Stack all patients into a single (N, 8) matrix
+        try:
+            X = np.array([[row[field] for field in predictor.feature_names] for row in data], dtype=np.float32)
+        except KeyError as e:
+            return jsonify({'error': f'Missing field: {e.args[0]}'}), 400
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Invalid input data'}), 400
+
+        mask = predictor.validate_batch(X)
+        if not mask.all():
+            return jsonify({
+                'error': 'Invalid input data',
+                'invalid_rows': np.nonzero(~mask)[0].tolist()
+            }), 400
+
+        columns, _ = predictor.predict_matrix(X)
+        results = [
+            {
+                'prediction': label,
+                'probability': percent,
+                'risk_category': category,
+                'risk_color': color,
+                'recommendations': recommendations
+            }
+            for label, percent, category, color, recommendations in zip(
+                columns['prediction_label'].tolist(),
+                columns['probability_percent'].tolist(),
+                columns['risk_category'].tolist(),
+                columns['risk_color'].tolist(),
+                columns['recommendations']
+            )
+        ]
+
+        return jsonify({
+            'success': True,
+            'results': results,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
+
 @app.route('/health')
 def health_check():
     """Health check endpoint for deployment"""
@@ -133,7 +184,8 @@ def get_stats():
         'total_predictions': 0,  # Would come from database
         'high_risk_detected': 0,  # Would come from database
         'model_accuracy': '85.2%',  # From model evaluation
-        'last_updated': '2024-10-15'
+        'last_updated': '2024-10-15',
+        'prediction_cache': _infer.cache_info()._asdict()
     }
 
     return jsonify(stats)
@@ -144,7 +196,9 @@ if __name__ == '__main__':
         print("🚀 Starting Diabetes Prediction Web Application...")
         print("📱 Access the application at: http://localhost:5000")
         print("🛑 Press Ctrl+C to stop the server")
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        print("💡 For production use: gunicorn -c gunicorn.conf.py wsgi:app")
+        # Development server only; production runs through wsgi.py
+        app.run(host='0.0.0.0', port=5000)
     else:
         print("❌ Failed to initialize predictor. Please ensure model files are present.")
         print("💡 Make sure these files exist:")
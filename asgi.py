@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+ASGI entrypoint for production deployment
+Klinik Sehat Sentosa
+
+Serves /predict from FastAPI, running the model in a worker thread so the
+event loop keeps handling other requests. All other routes (pages, static
+files, /health, /api/stats) are served by the Flask app mounted below.
+
+Usage:
+    uvicorn asgi:app --workers $(nproc) --loop uvloop --http httptools
+"""
+
+import asyncio
+from a2wsgi import WSGIMiddleware
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+import app as web
+from diabetes_predictor import InvalidInputError
+
+if not web.initialize_predictor():
+    raise RuntimeError("Model files not found. Please ensure diabetes_prediction_model_*.pkl "
+                       "and diabetes_scaler.pkl are present.")
+
+class PredictIn(BaseModel):
+    """Request body for /predict, matching the web form field names"""
+    pregnancies: float
+    glucose: float
+    blood_pressure: float
+    skin_thickness: float
+    insulin: float
+    bmi: float
+    diabetes_pedigree: float
+    age: float
+
+class PredictOut(BaseModel):
+    """Response body for /predict"""
+    success: bool
+    prediction: str
+    probability: str
+    risk_category: str
+    risk_color: str
+    recommendations: list[str]
+    timestamp: str
+
+app = FastAPI(title='Diabetes Risk Prediction API')
+
+@app.exception_handler(RequestValidationError)
+async def validation_error(request, exc):
+    """Return validation errors in the same format as the Flask app"""
+    error = exc.errors()[0]
+    loc = error['loc']
+    if len(loc) != 2 or loc[0] != 'body' or not isinstance(loc[1], str):
+        message = 'Invalid JSON body'
+    elif error['type'] == 'missing':
+        message = f'Missing field: {loc[1]}'
+    else:
+        message = f'Invalid value for {loc[1]}'
+    return JSONResponse({'error': message}, status_code=400)
+
+@app.post('/predict', response_model=PredictOut)
+async def predict(body: PredictIn):
+    """Handle prediction request via AJAX"""
+    prediction_data = {feature: getattr(body, field) for field, feature in web.FIELD_MAP.items()}
+
+    try:
+        result = await asyncio.to_thread(web.predictor.predict_single, prediction_data)
+    except InvalidInputError as e:
+        return JSONResponse({'error': 'Invalid input data', 'invalid_fields': e.fields}, status_code=400)
+    except Exception as e:
+        return JSONResponse({'error': f'Prediction failed: {str(e)}'}, status_code=500)
+
+    return PredictOut(
+        success=True,
+        prediction=result['prediction_label'],
+        probability=result['probability_percent'],
+        risk_category=result['risk_category'],
+        risk_color=result['risk_color'],
+        recommendations=result['recommendations'],
+        timestamp=result['timestamp']
+    )
+
+# Remaining routes are served by the Flask app
+app.mount('/', WSGIMiddleware(web.app))
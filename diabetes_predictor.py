@@ -9,37 +9,233 @@ yang telah dilatih pada data rekam medis pasien.
 Usage:
     python diabetes_predictor.py --interactive
     python diabetes_predictor.py --batch input.csv
+    python diabetes_predictor.py --compile --model model.pkl --scaler diabetes_scaler.pkl
 """
 
 import numpy as np
 import pandas as pd
+import pyarrow.csv as pacsv
 import joblib
+from joblib import Parallel, delayed
 import argparse
 import json
 from datetime import datetime
 import os
 import sys
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from model_loader import discover_models
+
+# Kategori risiko: indeks 0 = Low, 1 = Medium, 2 = High
+_RISK_THRESHOLDS = (0.3, 0.7)
+_LABELS = ('Low Risk', 'Medium Risk', 'High Risk')
+_COLORS = ('🟢', '🟡', '🔴')
+
+def _object_array(items):
+    """Array objek 1-D dari items tanpa broadcasting isinya (misal list rekomendasi)"""
+    arr = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        arr[i] = item
+    return arr
+
+def _categorize(probability):
+    """Konversi probabilitas ke indeks kategori risiko (0, 1, atau 2)"""
+    return bisect_right(_RISK_THRESHOLDS, probability)
+
+# Buffer input (1, 8) per thread, dipakai ulang di setiap panggilan _infer
+_scratch = threading.local()
+
+@lru_cache(maxsize=4096)
+def _infer(model, scaler, features):
+    """
+    Inferensi model untuk satu pasien, di-cache berdasarkan tuple fitur
+
+    Model dan scaler di-hash berdasarkan identitas objek, sehingga cache
+    otomatis terpisah untuk setiap model yang dimuat.
+
+    Args:
+        model: Estimator scikit-learn yang telah dilatih
+        scaler: Scaler untuk model linear, atau None jika model tidak butuh scaling
+        features (tuple): 8 nilai fitur dengan urutan feature_names
+
+    Returns:
+        tuple: (prediction, probability)
+    """
+    input_array = getattr(_scratch, 'buf', None)
+    if input_array is None:
+        input_array = _scratch.buf = np.empty((1, 8), dtype=np.float32)
+    input_array[0] = features
+    X = scaler.transform(input_array) if scaler is not None else input_array
+
+    # Label diturunkan dari probabilitas, tanpa memanggil model.predict lagi
+    proba_row = model.predict_proba(X)[0]
+    probability = float(proba_row[1])
+    if len(proba_row) == 2:
+        prediction = int(probability > 0.5)
+    else:
+        prediction = int(np.argmax(proba_row))
+    return prediction, probability
+
+class InvalidInputError(ValueError):
+    """Input pasien tidak valid; atribut fields berisi nama field yang bermasalah"""
+
+    def __init__(self, fields):
+        super().__init__(f"Nilai tidak valid untuk: {', '.join(fields)}")
+        self.fields = fields
+
+class OnnxModel:
+    """
+    Model hasil kompilasi ONNX dengan antarmuka predict_proba seperti scikit-learn
+
+    Scaling sudah termasuk di dalam graph ONNX (lihat compile_to_onnx), sehingga
+    input berupa fitur mentah.
+
+    onnxruntime baru di-import dan InferenceSession baru dibuat saat
+    predict_proba pertama kali dipanggil di setiap proses. Import onnxruntime
+    sudah menjalankan thread native, sehingga jika dilakukan di master
+    gunicorn (--preload) worker hasil fork crash saat keluar.
+    """
+
+    def __init__(self, model_path):
+        """
+        Args:
+            model_path (str | bytes): Path ke file .onnx, atau isi model ONNX
+        """
+        if isinstance(model_path, str) and not os.path.isfile(model_path):
+            raise FileNotFoundError(f"File model ONNX tidak ditemukan: {model_path}")
+        self._model_path = model_path
+        self._sess = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _session(self):
+        """InferenceSession milik proses saat ini"""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    import onnxruntime as ort
+
+                    self._sess = ort.InferenceSession(self._model_path, providers=['CPUExecutionProvider'])
+                    self._input_name = self._sess.get_inputs()[0].name
+                    self._proba_name = self._sess.get_outputs()[1].name
+                    self._pid = os.getpid()
+        return self._sess
+
+    def predict_proba(self, X):
+        sess = self._session()
+        proba = sess.run([self._proba_name], {self._input_name: np.asarray(X, dtype=np.float32)})[0]
+        # Graph ONNX menghasilkan float32; dibulatkan agar nilai tepat di batas
+        # kategori (misal 0.29999998 untuk 0.3) sama dengan hasil model .pkl
+        return np.round(proba.astype(np.float64), 6)
+
+def compile_to_onnx(model_path, scaler_path, output_path):
+    """
+    Kompilasi model scikit-learn (.pkl) ke format ONNX
+
+    Untuk model linear, scaler digabung ke dalam pipeline sehingga file
+    .onnx menerima fitur mentah. Sebelum disimpan, hasil model ONNX
+    dibandingkan dengan model .pkl pada sampel input dalam rentang valid;
+    file tidak ditulis jika kategori risikonya berbeda.
+
+    Args:
+        model_path (str): Path ke file model (.pkl)
+        scaler_path (str): Path ke file scaler (.pkl)
+        output_path (str): Path file .onnx yang dihasilkan
+    """
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    from sklearn.pipeline import make_pipeline
+
+    model = joblib.load(model_path)
+    estimator = model
+    if type(model).__name__ in {'LogisticRegression', 'SVC'}:
+        estimator = make_pipeline(joblib.load(scaler_path), model)
+
+    onnx_model = convert_sklearn(estimator, initial_types=[('X', FloatTensorType([None, 8]))],
+                                 options={type(model): {'zipmap': False}})
+    onnx_bytes = onnx_model.SerializeToString()
+
+    # Cek kesesuaian hasil ONNX dengan model .pkl
+    bounds = DiabetesPredictor()
+    X = np.random.default_rng(0).uniform(bounds._lo, bounds._hi, size=(1000, 8)).astype(np.float32)
+    expected = estimator.predict_proba(X)[:, 1]
+    actual = OnnxModel(onnx_bytes).predict_proba(X)[:, 1]
+    max_diff = float(np.max(np.abs(actual - expected)))
+    if (np.digitize(actual, _RISK_THRESHOLDS) != np.digitize(expected, _RISK_THRESHOLDS)).any():
+        print(f"❌ Hasil model ONNX berbeda dengan model .pkl (selisih maksimum {max_diff:.2e})")
+        sys.exit(1)
+    print(f"✓ Hasil model ONNX sesuai dengan model .pkl (selisih maksimum {max_diff:.2e})")
+
+    with open(output_path, 'wb') as f:
+        f.write(onnx_bytes)
+    print(f"✓ Model ONNX disimpan ke: {output_path}")
 
 class DiabetesPredictor:
     """
     Kelas untuk prediksi risiko diabetes menggunakan model yang telah dilatih
     """
 
+    # Rekomendasi per kategori risiko
+    _BASE_RECS = (
+        "Maintain healthy diet with balanced nutrition",
+        "Regular physical exercise (150 minutes/week)",
+        "Monitor blood glucose regularly",
+        "Maintain healthy weight"
+    )
+    _HIGH_RECS = _BASE_RECS + (
+        "⚠️ Immediate consultation with endocrinologist recommended",
+        "Consider HbA1c and oral glucose tolerance test",
+        "Strict diet modification and lifestyle changes",
+        "Monthly follow-up appointments"
+    )
+    _MED_RECS = _BASE_RECS + (
+        "Schedule follow-up in 3-6 months",
+        "Consider dietary consultation",
+        "Increase physical activity intensity",
+        "Monitor BMI and blood pressure"
+    )
+    _LOW_RECS = _BASE_RECS + (
+        "Continue healthy lifestyle",
+        "Annual screening recommended",
+        "Maintain current health status"
+    )
+    # Urutan sesuai _LABELS
+    _RECS = (_LOW_RECS, _MED_RECS, _HIGH_RECS)
+
+    # Tabel string persentase dengan resolusi 0.1%, diindeks dengan round(probability * 1000)
+    _PCT_TABLE = tuple(f"{i / 10:.1f}%" for i in range(1001))
+
+    # Tabel lookup untuk prediksi vektor (predict_matrix)
+    _PCT_ARRAY = np.array(_PCT_TABLE)
+    _LABEL_ARRAY = np.array(_LABELS)
+    _COLOR_ARRAY = np.array(_COLORS)
+    _PREDICTION_LABEL_ARRAY = np.array(['No Diabetes', 'Diabetes'])
+    _RECS_ARRAY = _object_array([list(recs) for recs in _RECS])
+
+    # Batch dengan jumlah baris minimal ini diprediksi paralel per chunk
+    _PARALLEL_MIN_ROWS = 100_000
+
     def __init__(self, model_path=None, scaler_path=None):
         """
         Inisialisasi predictor
 
         Args:
-            model_path (str): Path ke file model (.pkl)
+            model_path (str): Path ke file model (.pkl atau .onnx)
             scaler_path (str): Path ke file scaler (.pkl)
         """
         self.model = None
         self.scaler = None
+        self._needs_scaling = False
         self.feature_names = [
             'Pregnancies', 'Glucose', 'BloodPressure', 'SkinThickness',
             'Insulin', 'BMI', 'DiabetesPedigreeFunction', 'Age'
         ]
 
+        # Rentang nilai valid, urutan sesuai feature_names
+        self._lo = np.array([0, 50, 40, 0, 0, 10, 0, 10], dtype=np.float64)
+        self._hi = np.array([20, 300, 200, 100, 900, 60, 3, 120], dtype=np.float64)
+
         if model_path and scaler_path:
             self.load_model(model_path, scaler_path)
 
@@ -52,14 +248,21 @@ class DiabetesPredictor:
             scaler_path (str): Path ke file scaler
         """
         try:
-            self.model = joblib.load(model_path)
-            self.scaler = joblib.load(scaler_path)
+            if model_path.endswith('.onnx'):
+                self.model = OnnxModel(model_path)
+            else:
+                # mmap_mode='r' agar array numpy model dibagi lewat page cache antar worker
+                self.model = joblib.load(model_path, mmap_mode='r')
+            self.scaler = joblib.load(scaler_path, mmap_mode='r')
             print(f"✓ Model berhasil dimuat dari: {model_path}")
             print(f"✓ Scaler berhasil dimuat dari: {scaler_path}")
         except Exception as e:
             print(f"❌ Error loading model: {e}")
             sys.exit(1)
 
+        # Hanya model linear yang dilatih dengan data ter-scaling (model ONNX sudah termasuk scaler)
+        self._needs_scaling = type(self.model).__name__ in {'LogisticRegression', 'SVC'}
+
     def validate_input(self, data):
         """
         Validasi input data medis
@@ -68,35 +271,36 @@ class DiabetesPredictor:
             data (dict): Dictionary dengan data pasien
 
         Returns:
-            bool: True jika valid, False jika tidak
+            list: Nama field yang hilang atau tidak valid (kosong jika semua valid)
         """
-        required_fields = self.feature_names
-
-        # Cek kelengkapan field
-        for field in required_fields:
-            if field not in data:
-                print(f"❌ Field '{field}' tidak ditemukan")
-                return False
-
-        # Validasi range nilai
-        validations = {
-            'Pregnancies': (0, 20),
-            'Glucose': (50, 300),
-            'BloodPressure': (40, 200),
-            'SkinThickness': (0, 100),
-            'Insulin': (0, 900),
-            'BMI': (10, 60),
-            'DiabetesPedigreeFunction': (0, 3),
-            'Age': (10, 120)
-        }
+        try:
+            arr = np.fromiter((data[field] for field in self.feature_names), dtype=np.float64, count=8)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            # Field yang hilang, non-numerik, atau terlalu besar diisi NaN agar ikut tidak valid
+            arr = np.full(8, np.nan)
+            for i, field in enumerate(self.feature_names):
+                if field not in data:
+                    continue
+                try:
+                    arr[i] = float(data[field])
+                except (TypeError, ValueError, OverflowError):
+                    pass
+
+        # Validasi range nilai (NaN otomatis tidak valid)
+        bad = ~((arr >= self._lo) & (arr <= self._hi))
+        return [self.feature_names[i] for i in np.nonzero(bad)[0]]
+
+    def validate_batch(self, X):
+        """
+        Validasi range nilai untuk banyak pasien sekaligus
 
-        for field, (min_val, max_val) in validations.items():
-            value = data[field]
-            if not isinstance(value, (int, float)) or not (min_val <= value <= max_val):
-                print(f"❌ Nilai '{field}' tidak valid: {value} (harus {min_val}-{max_val})")
-                return False
+        Args:
+            X (np.ndarray): Matriks fitur (N, 8) dengan urutan feature_names
 
-        return True
+        Returns:
+            np.ndarray: Mask boolean (N,), True untuk baris yang valid
+        """
+        return ((X >= self._lo) & (X <= self._hi)).all(axis=1)
 
     def predict_single(self, patient_data):
         """
@@ -107,88 +311,77 @@ class DiabetesPredictor:
 
         Returns:
             dict: Hasil prediksi dengan probabilitas dan kategori risiko
+
+        Raises:
+            InvalidInputError: Jika ada field yang hilang atau tidak valid
         """
-        if not self.validate_input(patient_data):
-            return None
+        invalid = self.validate_input(patient_data)
+        if invalid:
+            raise InvalidInputError(invalid)
 
-        # Siapkan data input
-        input_array = np.array([[
-            patient_data['Pregnancies'],
-            patient_data['Glucose'],
-            patient_data['BloodPressure'],
-            patient_data['SkinThickness'],
-            patient_data['Insulin'],
-            patient_data['BMI'],
-            patient_data['DiabetesPedigreeFunction'],
-            patient_data['Age']
-        ]])
-
-        # Prediksi dengan atau tanpa scaling tergantung model
-        model_name = type(self.model).__name__
-        if model_name in ['LogisticRegression', 'SVC']:
-            input_scaled = self.scaler.transform(input_array)
-            prediction = self.model.predict(input_scaled)[0]
-            probability = self.model.predict_proba(input_scaled)[0][1]
-        else:
-            prediction = self.model.predict(input_array)[0]
-            probability = self.model.predict_proba(input_array)[0][1]
-
-        # Kategorisasi risiko
-        if probability < 0.3:
-            risk_category = "Low Risk"
-            risk_color = "🟢"
-        elif probability < 0.7:
-            risk_category = "Medium Risk"
-            risk_color = "🟡"
-        else:
-            risk_category = "High Risk"
-            risk_color = "🔴"
+        # Siapkan data input, dibulatkan agar input berulang memakai cache
+        features = tuple(round(float(patient_data[field]), 3) for field in self.feature_names)
+        prediction, probability = _infer(self.model, self.scaler if self._needs_scaling else None, features)
 
-        # Rekomendasi berdasarkan risiko
-        recommendations = self._get_recommendations(risk_category, patient_data)
+        # Kategorisasi risiko dan rekomendasi
+        idx = _categorize(probability)
+        risk_category = _LABELS[idx]
+        risk_color = _COLORS[idx]
+        recommendations = self._RECS[idx]
 
         return {
             'prediction': int(prediction),
             'prediction_label': 'Diabetes' if prediction == 1 else 'No Diabetes',
             'probability': float(probability),
-            'probability_percent': f"{probability * 100:.1f}%",
+            'probability_percent': self._PCT_TABLE[min(1000, round(probability * 1000))],
             'risk_category': risk_category,
             'risk_color': risk_color,
             'recommendations': recommendations,
             'timestamp': datetime.now().isoformat()
         }
 
-    def _get_recommendations(self, risk_category, patient_data):
+    def _predict_chunk(self, X):
         """
-        Generate rekomendasi berdasarkan kategori risiko dan data pasien
+        Probabilitas diabetes untuk satu chunk matriks fitur
         """
-        base_recommendations = [
-            "Maintain healthy diet with balanced nutrition",
-            "Regular physical exercise (150 minutes/week)",
-            "Monitor blood glucose regularly",
-            "Maintain healthy weight"
-        ]
+        return self.model.predict_proba(X)[:, 1]
 
-        if risk_category == "High Risk":
-            return base_recommendations + [
-                "⚠️ Immediate consultation with endocrinologist recommended",
-                "Consider HbA1c and oral glucose tolerance test",
-                "Strict diet modification and lifestyle changes",
-                "Monthly follow-up appointments"
-            ]
-        elif risk_category == "Medium Risk":
-            return base_recommendations + [
-                "Schedule follow-up in 3-6 months",
-                "Consider dietary consultation",
-                "Increase physical activity intensity",
-                "Monitor BMI and blood pressure"
-            ]
+    def predict_matrix(self, X):
+        """
+        Prediksi vektor untuk matriks fitur yang sudah divalidasi
+
+        Args:
+            X (np.ndarray): Matriks fitur (N, 8) dengan urutan feature_names
+
+        Returns:
+            tuple: (dict kolom hasil berupa np.ndarray, indeks kategori risiko per baris)
+        """
+        # Prediksi seluruh baris dalam satu panggilan model
+        if self._needs_scaling:
+            X = self.scaler.transform(X)
+        if len(X) >= self._PARALLEL_MIN_ROWS:
+            n_jobs = os.cpu_count() or 1
+            chunks = np.array_split(X, n_jobs)
+            proba = np.concatenate(Parallel(n_jobs=n_jobs, prefer='threads')(
+                delayed(self._predict_chunk)(chunk) for chunk in chunks))
         else:
-            return base_recommendations + [
-                "Continue healthy lifestyle",
-                "Annual screening recommended",
-                "Maintain current health status"
-            ]
+            proba = self._predict_chunk(X)
+        prediction = (proba > 0.5).astype(int)
+
+        # Kategorisasi risiko: 0 = Low, 1 = Medium, 2 = High
+        cats = np.digitize(proba, _RISK_THRESHOLDS)
+        pct_idx = np.clip(np.rint(proba * 1000).astype(int), 0, 1000)
+
+        columns = {
+            'prediction': prediction,
+            'prediction_label': self._PREDICTION_LABEL_ARRAY[prediction],
+            'probability': proba,
+            'probability_percent': self._PCT_ARRAY[pct_idx],
+            'risk_category': self._LABEL_ARRAY[cats],
+            'risk_color': self._COLOR_ARRAY[cats],
+            'recommendations': self._RECS_ARRAY[cats]
+        }
+        return columns, cats
 
     def predict_batch(self, csv_path, output_path=None):
         """
@@ -197,18 +390,36 @@ class DiabetesPredictor:
         Args:
             csv_path (str): Path ke file CSV input
             output_path (str): Path untuk menyimpan hasil (optional)
+
+        Returns:
+            pd.DataFrame | None: Hasil prediksi per pasien, atau None jika gagal atau tidak ada baris valid
         """
         try:
-            df = pd.read_csv(csv_path)
-            print(f"📊 Processing {len(df)} patients...")
-
-            results = []
-            for idx, row in df.iterrows():
-                patient_data = row.to_dict()
-                result = self.predict_single(patient_data)
-                if result:
-                    result['patient_id'] = idx + 1
-                    results.append(result)
+            timestamp = datetime.now().isoformat()
+            table = pacsv.read_csv(csv_path)
+            print(f"📊 Processing {table.num_rows} patients...")
+
+            X = table.select(self.feature_names).to_pandas().to_numpy(dtype=np.float32)
+            patient_id = np.arange(1, table.num_rows + 1)
+
+            # Validasi seluruh baris sekaligus
+            mask = self.validate_batch(X)
+            invalid_rows = np.where(~mask)[0]
+            if len(invalid_rows):
+                print(f"❌ Skipping {len(invalid_rows)} invalid rows: {(invalid_rows + 1).tolist()}")
+            X = X[mask]
+            patient_id = patient_id[mask]
+            n = len(X)
+            if n == 0:
+                print("❌ Tidak ada baris valid untuk diprediksi")
+                return None
+
+            columns, cats = self.predict_matrix(X)
+            results = pd.DataFrame({
+                **columns,
+                'timestamp': np.full(n, timestamp, dtype=object),
+                'patient_id': patient_id
+            })
 
             # Simpan hasil
             if output_path:
@@ -217,19 +428,16 @@ class DiabetesPredictor:
                 if output_dir and not os.path.exists(output_dir):
                     os.makedirs(output_dir, exist_ok=True)
 
-                output_df = pd.DataFrame(results)
-                output_df.to_csv(output_path, index=False)
+                results.to_csv(output_path, index=False, chunksize=100_000)
                 print(f"✓ Results saved to: {output_path}")
 
             # Summary
-            high_risk = sum(1 for r in results if r['risk_category'] == 'High Risk')
-            medium_risk = sum(1 for r in results if r['risk_category'] == 'Medium Risk')
-            low_risk = sum(1 for r in results if r['risk_category'] == 'Low Risk')
+            low_risk, medium_risk, high_risk = np.bincount(cats, minlength=3)
 
             print(f"\n📈 RISK DISTRIBUTION:")
-            print(f"🔴 High Risk: {high_risk} patients ({high_risk/len(results)*100:.1f}%)")
-            print(f"🟡 Medium Risk: {medium_risk} patients ({medium_risk/len(results)*100:.1f}%)")
-            print(f"🟢 Low Risk: {low_risk} patients ({low_risk/len(results)*100:.1f}%)")
+            print(f"🔴 High Risk: {high_risk} patients ({high_risk/n*100:.1f}%)")
+            print(f"🟡 Medium Risk: {medium_risk} patients ({medium_risk/n*100:.1f}%)")
+            print(f"🟢 Low Risk: {low_risk} patients ({low_risk/n*100:.1f}%)")
 
             return results
 
@@ -266,28 +474,29 @@ def interactive_mode(predictor):
             print("\n🔄 Processing...")
             result = predictor.predict_single(patient_data)
 
-            if result:
-                print(f"\n{result['risk_color']} HASIL PREDIKSI {result['risk_color']}")
-                print(f"Prediksi: {result['prediction_label']}")
-                print(f"Probabilitas: {result['probability_percent']}")
-                print(f"Kategori Risiko: {result['risk_category']}")
+            print(f"\n{result['risk_color']} HASIL PREDIKSI {result['risk_color']}")
+            print(f"Prediksi: {result['prediction_label']}")
+            print(f"Probabilitas: {result['probability_percent']}")
+            print(f"Kategori Risiko: {result['risk_category']}")
 
-                print(f"\n💡 REKOMENDASI:")
-                for i, rec in enumerate(result['recommendations'], 1):
-                    print(f"  {i}. {rec}")
+            print(f"\n💡 REKOMENDASI:")
+            for i, rec in enumerate(result['recommendations'], 1):
+                print(f"  {i}. {rec}")
 
-                # Simpan hasil jika diinginkan
-                save = input(f"\nSimpan hasil ke file? (y/n): ").lower().strip()
-                if save == 'y':
-                    # Create output directory if it doesn't exist
-                    os.makedirs('output/predictions', exist_ok=True)
+            # Simpan hasil jika diinginkan
+            save = input(f"\nSimpan hasil ke file? (y/n): ").lower().strip()
+            if save == 'y':
+                # Create output directory if it doesn't exist
+                os.makedirs('output/predictions', exist_ok=True)
 
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"output/predictions/diabetes_prediction_{timestamp}.json"
-                    with open(filename, 'w') as f:
-                        json.dump(result, f, indent=2)
-                    print(f"✓ Hasil disimpan ke: {filename}")
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"output/predictions/diabetes_prediction_{timestamp}.json"
+                with open(filename, 'w') as f:
+                    json.dump(result, f, indent=2)
+                print(f"✓ Hasil disimpan ke: {filename}")
 
+        except InvalidInputError as e:
+            print(f"❌ {e}")
         except ValueError as e:
             print(f"❌ Input tidak valid: {e}")
         except KeyboardInterrupt:
@@ -309,22 +518,20 @@ def main():
     parser.add_argument('--output', type=str,
                        help='Output path for batch prediction results')
     parser.add_argument('--model', type=str,
-                       help='Path to model file (.pkl)')
+                       help='Path to model file (.pkl or .onnx)')
     parser.add_argument('--scaler', type=str,
                        help='Path to scaler file (.pkl)')
+    parser.add_argument('--compile', action='store_true',
+                       help='Compile the .pkl model to ONNX (saved to --output or <model>.onnx)')
 
     args = parser.parse_args()
 
-    # Auto-detect model files jika tidak dispesifikasi
-    model_files = [f for f in os.listdir('.') if f.startswith('diabetes_prediction_model_') and f.endswith('.pkl')]
-    scaler_file = 'diabetes_scaler.pkl'
-
     if args.model and args.scaler:
         model_path = args.model
         scaler_path = args.scaler
-    elif model_files and os.path.exists(scaler_file):
-        model_path = model_files[0]  # Ambil model pertama yang ditemukan
-        scaler_path = scaler_file
+    elif model_files := discover_models(prefer_onnx=not args.compile):
+        # Auto-detect model files jika tidak dispesifikasi
+        model_path, scaler_path = model_files
         print(f"🔍 Auto-detected model: {model_path}")
         print(f"🔍 Auto-detected scaler: {scaler_path}")
     else:
@@ -332,6 +539,11 @@ def main():
         print("Pastikan file model (.pkl) dan scaler (diabetes_scaler.pkl) ada di direktori yang sama.")
         sys.exit(1)
 
+    if args.compile:
+        output_path = args.output or os.path.splitext(model_path)[0] + '.onnx'
+        compile_to_onnx(model_path, scaler_path, output_path)
+        return
+
     # Inisialisasi predictor
     predictor = DiabetesPredictor(model_path, scaler_path)
 
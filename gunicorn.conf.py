@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for the Diabetes Prediction Web Application
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# One process per core; each worker holds a warm DiabetesPredictor
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = 2
+
+# Load the model once in the master and share it with the workers
+preload_app = True
+
+timeout = 30
+keepalive = 5
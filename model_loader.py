@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Model file discovery
+Klinik Sehat Sentosa
+
+Shared auto-detection of the trained model and scaler files, used by both the
+web application and the command line predictor.
+"""
+
+from functools import cache
+from pathlib import Path
+
+@cache
+def discover_models(prefer_onnx=True):
+    """
+    Cari file model dan scaler di direktori saat ini, lalu di folder models
+
+    Jika ada hasil kompilasi ONNX dengan nama yang sama (lihat
+    diabetes_predictor.py --compile) yang tidak lebih lama dari file .pkl,
+    file .onnx tersebut yang dipakai. File .onnx yang lebih lama (model
+    sudah dilatih ulang) diabaikan.
+
+    Hasil di-cache sehingga pencarian hanya dilakukan sekali per proses
+    (dengan gunicorn --preload, sekali di master).
+
+    Args:
+        prefer_onnx (bool): False untuk selalu mengembalikan file .pkl
+
+    Returns:
+        tuple | None: (model_path, scaler_path), atau None jika tidak ditemukan
+    """
+    for directory in (Path('.'), Path('models')):
+        model_files = sorted(directory.glob('diabetes_prediction_model_*.pkl'))
+        scaler_file = directory / 'diabetes_scaler.pkl'
+        if model_files and scaler_file.exists():
+            model_file = model_files[0]
+            onnx_file = model_file.with_suffix('.onnx')
+            if (prefer_onnx and onnx_file.exists()
+                    and onnx_file.stat().st_mtime >= model_file.stat().st_mtime):
+                model_file = onnx_file
+            return str(model_file), str(scaler_file)
+    return None
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+WSGI entrypoint for production deployment
+Klinik Sehat Sentosa
+
+Loads the predictor at import time so that gunicorn's --preload loads the
+model once in the master process and shares it with the forked workers.
+
+Usage:
+    gunicorn -w $(nproc) -k gthread --threads 2 --preload wsgi:app
+"""
+
+from app import app, initialize_predictor
+
+if not initialize_predictor():
+    raise RuntimeError("Model files not found. Please ensure diabetes_prediction_model_*.pkl "
+                       "and diabetes_scaler.pkl are present.")